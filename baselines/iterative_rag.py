@@ -38,7 +38,7 @@ class IterativeRAG:
         self.coverage_threshold = coverage_threshold
 
     def query(self, question: str, information_checklist: list[str] | None = None) -> GenerationResult:
-        start = time.time()
+        start = time.perf_counter()
         total_prompt_tokens = 0
         total_completion_tokens = 0
         all_chunks = []
@@ -83,7 +83,7 @@ class IterativeRAG:
                 total_completion_tokens += follow_resp.completion_tokens
                 iterations += 1
 
-        total_latency = time.time() - start
+        total_latency = time.perf_counter() - start
 
         combined_retrieval = RetrievalResult(
             chunks=all_chunks,
@@ -19,14 +19,14 @@ class VanillaRAG:
         self.top_k = top_k
 
     def query(self, question: str) -> GenerationResult:
-        start = time.time()
+        start = time.perf_counter()
 
         retrieval_result = self.vector_store.search(question, top_k=self.top_k)
         context = self._format_context(retrieval_result)
         prompt = VANILLA_RAG_USER.format(context=context, query=question)
         llm_resp = self.llm.generate(prompt, system_prompt=VANILLA_RAG_SYSTEM)
 
-        total_latency = time.time() - start
+        total_latency = time.perf_counter() - start
 
         return GenerationResult(
             answer=llm_resp.text,
@@ -75,9 +75,9 @@ class AppConfig(BaseModel):
 def load_config(config_path: str | Path | None = None) -> AppConfig:
     if config_path is None:
         config_path = Path(__file__).parent.parent / "config" / "config.yaml"
-    config_path = Path(config_path)
-    if not config_path.exists():
+    try:
+        with open(config_path) as f:
+            raw = yaml.safe_load(f) or {}
+    except FileNotFoundError:
         return AppConfig()
-    with open(config_path) as f:
-        raw = yaml.safe_load(f) or {}
     return AppConfig(**raw)
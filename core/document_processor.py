@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import re
 import uuid
 from datetime import datetime
@@ -10,57 +11,86 @@ from typing import Optional
 
 from core.data_models import DocumentChunk
 
+_FM_NAME_RE = re.compile(r"FM[_\s]?(\d+[\-\.]\d+)", re.IGNORECASE)
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+
 
 def _extract_text_from_pdf(pdf_path: Path) -> str:
     """Extract text from a PDF file. Tries PyMuPDF first, falls back to pdfplumber."""
     try:
         import fitz  # PyMuPDF
         doc = fitz.open(str(pdf_path))
-        text = ""
-        for page in doc:
-            text += page.get_text() + "\n"
+        pages = [page.get_text() for page in doc]
         doc.close()
-        return text
+        return "".join(f"{page_text}\n" for page_text in pages)
     except ImportError:
         pass
     try:
         import pdfplumber
-        text = ""
+        pages = []
         with pdfplumber.open(str(pdf_path)) as pdf:
             for page in pdf.pages:
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n"
-        return text
+                    pages.append(page_text)
+        return "".join(f"{page_text}\n" for page_text in pages)
     except ImportError:
         pass
-    with open(pdf_path, "r", errors="ignore") as f:
-        return f.read()
+    return pdf_path.read_bytes().decode("utf-8", errors="ignore")
 
 
 def _identify_fm_name(filename: str) -> str:
     """Extract FM designation from filename (e.g., 'ARN43326-FM_3-0-000-WEB-1.pdf' -> 'FM 3-0')."""
-    match = re.search(r"FM[_\s]?(\d+[\-\.]\d+)", filename, re.IGNORECASE)
+    match = _FM_NAME_RE.search(filename)
     if match:
         num = match.group(1).replace("_", "-")
         return f"FM {num}"
     return filename
 
 
-def _detect_section(text: str, position: int) -> tuple[str, str]:
-    """Detect the nearest section/chapter heading before this position."""
-    heading_patterns = [
-        r"(Chapter\s+\d+)\s*\n\s*([A-Z][A-Z\s,]+)",
-        r"(Section\s+[IVX]+)\s*[-–]\s*(.+)",
-        r"(Appendix\s+[A-Z])\s*\n\s*([A-Z][A-Z\s,]+)",
-        r"(\d+-\d+)\.\s",
-    ]
+_HEADING_PATTERNS = [
+    re.compile(r"(Chapter\s+\d+)\s*\n\s*([A-Z][A-Z\s,]+)"),
+    re.compile(r"(Section\s+[IVX]+)\s*[-–]\s*(.+)"),
+    re.compile(r"(Appendix\s+[A-Z])\s*\n\s*([A-Z][A-Z\s,]+)"),
+    re.compile(r"(\d+-\d+)\.\s"),
+]
+# Per heading pattern: (pattern, matches in document order, match end offsets)
+_Headings = list[tuple[re.Pattern[str], list[re.Match[str]], list[int]]]
+
+
+def _find_headings(text: str) -> _Headings:
+    """Scan the whole document once per heading pattern; returns (pattern, matches, match ends)."""
+    headings = []
+    for pattern in _HEADING_PATTERNS:
+        matches = list(pattern.finditer(text))
+        headings.append((pattern, matches, [m.end() for m in matches]))
+    return headings
+
+
+def _detect_section(
+    text: str,
+    position: int,
+    headings: Optional[_Headings] = None,
+) -> tuple[str, str]:
+    """Detect the nearest section/chapter heading before this position.
+
+    Pass headings from _find_headings(text) to reuse one document scan across positions.
+    """
+    if headings is None:
+        headings = _find_headings(text)
     best_id = "unknown"
     best_title = ""
-    for pattern in heading_patterns:
-        for m in re.finditer(pattern, text[:position]):
-            best_id = m.group(1).strip()
-            best_title = m.group(2).strip() if m.lastindex >= 2 else ""
+    for pattern, matches, ends in headings:
+        # Matches ending by `position` are exactly the leading matches of text[:position];
+        # only a match straddling `position` needs a rescan against the cut-off text.
+        k = bisect.bisect_right(ends, position)
+        last = matches[k - 1] if k else None
+        if k < len(matches) and matches[k].start() < position:
+            for m in pattern.finditer(text, matches[k].start(), position):
+                last = m
+        if last is not None:
+            best_id = last.group(1).strip()
+            best_title = last.group(2).strip() if last.lastindex >= 2 else ""
     return best_id, best_title
 
 
@@ -72,19 +102,20 @@ def chunk_text(
     timestamp: Optional[datetime] = None,
 ) -> list[DocumentChunk]:
     """Split text into overlapping chunks with metadata."""
-    paragraphs = re.split(r"\n\s*\n", text)
+    paragraphs = _PARAGRAPH_SPLIT_RE.split(text)
     chunks: list[DocumentChunk] = []
     current_chunk = ""
     current_section_id = "intro"
     current_section_title = ""
     char_position = 0
+    headings = _find_headings(text)
 
     for para in paragraphs:
         para = para.strip()
         if not para:
             continue
 
-        section_id, section_title = _detect_section(text, char_position)
+        section_id, section_title = _detect_section(text, char_position, headings)
         if section_id != "unknown":
             current_section_id = section_id
             current_section_title = section_title
@@ -131,7 +162,8 @@ def load_corpus(
     corpus_dir = Path(corpus_dir)
     all_chunks: list[DocumentChunk] = []
 
-    for pdf_path in sorted(corpus_dir.glob("*.pdf")):
+    pdf_paths = sorted(corpus_dir.glob("*.pdf"))
+    for pdf_path in pdf_paths:
         fm_name = _identify_fm_name(pdf_path.name)
         print(f"Processing {pdf_path.name} -> {fm_name}")
         text = _extract_text_from_pdf(pdf_path)
@@ -139,5 +171,5 @@ def load_corpus(
         all_chunks.extend(chunks)
         print(f"  -> {len(chunks)} chunks")
 
-    print(f"Total: {len(all_chunks)} chunks from {len(list(corpus_dir.glob('*.pdf')))} documents")
+    print(f"Total: {len(all_chunks)} chunks from {len(pdf_paths)} documents")
     return all_chunks
@@ -30,6 +30,13 @@ from evaluation.metrics import (
 )
 from evaluation.statistical import ComparisonResult, run_full_comparison
 
+_OVERRIDE_KEYWORDS = (
+    "approval", "higher", "authority", "cannot", "must coordinate",
+    "not independently", "commander's intent", "does not",
+    "exception", "override", "supersede", "notwithstanding",
+    "unless", "only when", "prohibited", "restricted",
+)
+
 
 class EvaluationHarness:
     """Run all evaluation metrics on system outputs and produce benchmark results."""
@@ -352,13 +359,16 @@ class EvaluationHarness:
         systems: list[tuple[str, list[BenchmarkResult]]],
     ) -> list[str]:
         lines = []
+
+        def _rate(hits: int, n: int) -> str:
+            return f"{hits}/{n} ({hits/max(n,1)*100:.0f}%)"
+
+        # Each flag is counted once per system and the count reused for the ratio
         categories = [
             ("Trap A: Overriding Directive", QueryCategory.TRAP_A,
-             "Fatal Error Rate", lambda rs: f"{sum(1 for r in rs if r.fatal_error)}/{len(rs)} "
-             f"({sum(1 for r in rs if r.fatal_error)/max(len(rs),1)*100:.0f}%)"),
+             "Fatal Error Rate", lambda rs: _rate(sum(1 for r in rs if r.fatal_error), len(rs))),
             ("Trap B: Distant Definition", QueryCategory.TRAP_B,
-             "Definition Retrieval Rate", lambda rs: f"{sum(1 for r in rs if r.definition_retrieved)}/{len(rs)} "
-             f"({sum(1 for r in rs if r.definition_retrieved)/max(len(rs),1)*100:.0f}%)"),
+             "Definition Retrieval Rate", lambda rs: _rate(sum(1 for r in rs if r.definition_retrieved), len(rs))),
             ("Trap C: Scattered Components", QueryCategory.TRAP_C,
              "Component Recall", lambda rs: f"{sum(r.component_recall for r in rs)/max(len(rs),1):.3f}"),
             ("Control: Single-Hop", QueryCategory.CONTROL,
@@ -438,11 +448,25 @@ class EvaluationHarness:
         systems: list[tuple[str, list[BenchmarkResult]]],
     ) -> list[str]:
         """Per-document breakdown: compute metrics for queries whose gold sources include each FM."""
+        # Retrieved sources per result, gathered once instead of per (doc, system) pair
+        system_sources = [
+            (name, [(r, {c.source_document for c in r.generation_result.retrieval_result.chunks})
+                    for r in results])
+            for name, results in systems
+        ]
         all_docs: set[str] = set()
-        for _, results in systems:
-            for r in results:
-                for c in r.generation_result.retrieval_result.chunks:
-                    all_docs.add(c.source_document)
+        for _, sourced in system_sources:
+            for _, sources in sourced:
+                all_docs.update(sources)
+
+        # A result counts toward every doc that is a substring of one of its sources
+        docs_in_source = {src: [doc for doc in all_docs if doc in src] for src in all_docs}
+        results_by_doc: dict[tuple[str, str], list[BenchmarkResult]] = {}
+        for name, sourced in system_sources:
+            for r, sources in sourced:
+                matched = {doc for src in sources for doc in docs_in_source[src]}
+                for doc in matched:
+                    results_by_doc.setdefault((doc, name), []).append(r)
 
         lines = []
         fm_metrics = ["information_unit_coverage", "evidence_recall", "component_recall",
@@ -452,11 +476,8 @@ class EvaluationHarness:
         lines.extend([header, sep])
 
         for doc in sorted(all_docs):
-            for name, results in systems:
-                doc_results = [
-                    r for r in results
-                    if any(doc in c.source_document for c in r.generation_result.retrieval_result.chunks)
-                ]
+            for name, _ in systems:
+                doc_results = results_by_doc.get((doc, name))
                 if not doc_results:
                     continue
                 n = len(doc_results)
@@ -684,16 +705,13 @@ class EvaluationHarness:
     @staticmethod
     def _extract_override_keywords(annotation: GoldAnnotation) -> list[str]:
         """Extract override-related keywords from the gold annotation's ground truth."""
-        keywords = [
-            "approval", "higher", "authority", "cannot", "must coordinate",
-            "not independently", "commander's intent", "does not",
-            "exception", "override", "supersede", "notwithstanding",
-            "unless", "only when", "prohibited", "restricted",
-        ]
+        keywords = list(_OVERRIDE_KEYWORDS)
+        seen = set(keywords)  # O(1) duplicate check; the list keeps keyword order
         gt_lower = annotation.ground_truth_answer.lower()
         for iu in annotation.information_units:
             words = [w.strip().lower() for w in iu.split() if len(w.strip()) > 4]
             for w in words:
-                if w in gt_lower and w not in keywords:
+                if w in gt_lower and w not in seen:
+                    seen.add(w)
                     keywords.append(w)
         return keywords
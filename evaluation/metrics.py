@@ -7,7 +7,11 @@ military-specific metrics (Benchmarks 3-5) and structural metrics (Benchmark 6).
 from __future__ import annotations
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Sequence
+
+_IU_KEYWORD_SPLIT_RE = re.compile(r"[,;:\-()]")
+_GOLD_FM_RE = re.compile(r"(FM\s+[\d\-]+)", re.IGNORECASE)
 
 
 # ---------------------------------------------------------------------------
@@ -21,7 +25,7 @@ def information_unit_coverage(answer: str, information_units: list[str]) -> floa
     covered = 0
     answer_lower = answer.lower()
     for unit in information_units:
-        keywords = [w.strip().lower() for w in re.split(r"[,;:\-()]", unit) if len(w.strip()) > 3]
+        keywords = [w.strip().lower() for w in _IU_KEYWORD_SPLIT_RE.split(unit) if len(w.strip()) > 3]
         if not keywords:
             covered += 1
             continue
@@ -48,10 +52,12 @@ def definition_retrieved(
     definition_keywords: list[str],
 ) -> bool:
     """Check if the definition from the correct FM was retrieved (Trap B metric)."""
+    fm_lower = definition_fm.lower()
+    keywords_lower = [kw.lower() for kw in definition_keywords]
     for src, text in zip(retrieved_sources, retrieved_texts):
-        if definition_fm.lower() in src.lower():
+        if fm_lower in src.lower():
             text_lower = text.lower()
-            if any(kw.lower() in text_lower for kw in definition_keywords):
+            if any(kw in text_lower for kw in keywords_lower):
                 return True
     return False
 
@@ -83,7 +89,7 @@ def evidence_recall(
     found = 0
     sources_lower = " ".join(retrieved_sources).lower()
     for ref in gold_section_references:
-        fm_match = re.search(r"(FM\s+[\d\-]+)", ref, re.IGNORECASE)
+        fm_match = _GOLD_FM_RE.search(ref)
         if fm_match and fm_match.group(1).lower() in sources_lower:
             found += 1
     return found / len(gold_section_references)
@@ -130,12 +136,17 @@ def mrr_at_k(
 # ROUGE-L (Benchmark 2)
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
+def _get_rouge_scorer():
+    """Build the stemming ROUGE-L scorer once; raises ImportError without rouge-score."""
+    from rouge_score import rouge_scorer
+    return rouge_scorer.RougeScorer(["rougeL"], use_stemmer=True)
+
+
 def compute_rouge_l(answer: str, reference: str) -> float:
     """Compute ROUGE-L F1 score using the official rouge-score library."""
     try:
-        from rouge_score import rouge_scorer
-        scorer = rouge_scorer.RougeScorer(["rougeL"], use_stemmer=True)
-        scores = scorer.score(reference, answer)
+        scores = _get_rouge_scorer().score(reference, answer)
         return scores["rougeL"].fmeasure
     except ImportError:
         return _rouge_l_fallback(answer, reference)
@@ -148,14 +159,17 @@ def _rouge_l_fallback(answer: str, reference: str) -> float:
     if not ans_tokens or not ref_tokens:
         return 0.0
     m, n = len(ref_tokens), len(ans_tokens)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
-    for i in range(1, m + 1):
+    # Two rolling rows instead of the full (m+1) x (n+1) table: O(n) memory
+    prev = [0] * (n + 1)
+    for ref_tok in ref_tokens:
+        curr = [0] * (n + 1)
         for j in range(1, n + 1):
-            if ref_tokens[i - 1] == ans_tokens[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1] + 1
+            if ref_tok == ans_tokens[j - 1]:
+                curr[j] = prev[j - 1] + 1
             else:
-                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-    lcs_len = dp[m][n]
+                curr[j] = max(prev[j], curr[j - 1])
+        prev = curr
+    lcs_len = prev[n]
     precision = lcs_len / n if n > 0 else 0.0
     recall = lcs_len / m if m > 0 else 0.0
     if precision + recall == 0:
@@ -167,6 +181,12 @@ def _rouge_l_fallback(answer: str, reference: str) -> float:
 # Official RAGAS metrics (Benchmarks 1-2)
 # ---------------------------------------------------------------------------
 
+_DEFAULT_RAGAS_METRICS = (
+    "context_recall", "context_precision", "faithfulness",
+    "answer_correctness", "answer_relevancy",
+)
+
+
 def _build_ragas_llm_and_embeddings():
     """Construct RAGAS 0.4.x LLM and embeddings from the project's OpenAI client.
 
@@ -182,13 +202,16 @@ def _build_ragas_llm_and_embeddings():
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         env_path = Path(__file__).parent.parent / ".env"
-        if env_path.exists():
-            for line in env_path.read_text().splitlines():
-                line = line.strip()
-                if line.startswith("OPENAI_API_KEY="):
-                    api_key = line.split("=", 1)[1].strip()
-                    os.environ["OPENAI_API_KEY"] = api_key
-                    break
+        try:
+            env_lines = env_path.read_text().splitlines()
+        except FileNotFoundError:
+            env_lines = []
+        for line in env_lines:
+            line = line.strip()
+            if line.startswith("OPENAI_API_KEY="):
+                api_key = line.split("=", 1)[1].strip()
+                os.environ["OPENAI_API_KEY"] = api_key
+                break
 
     if not api_key:
         raise EnvironmentError("OPENAI_API_KEY is not set — RAGAS metrics unavailable")
@@ -207,18 +230,13 @@ def compute_ragas_metrics(
     answer: str,
     ground_truth: str,
     retrieved_contexts: list[str],
-    metric_names: list[str] | None = None,
+    metric_names: Sequence[str] | None = None,
 ) -> dict[str, float]:
     """Compute official RAGAS 0.4.x metrics for a single query.
 
     Returns dict with keys: context_recall, context_precision, faithfulness,
     answer_correctness, answer_relevancy. Missing metrics default to 0.0.
     """
-    if metric_names is None:
-        metric_names = [
-            "context_recall", "context_precision", "faithfulness",
-            "answer_correctness", "answer_relevancy",
-        ]
     batch = compute_ragas_metrics_batch(
         [query], [answer], [ground_truth], [retrieved_contexts], metric_names
     )
@@ -230,7 +248,7 @@ def compute_ragas_metrics_batch(
     answers: list[str],
     ground_truths: list[str],
     retrieved_contexts_list: list[list[str]],
-    metric_names: list[str] | None = None,
+    metric_names: Sequence[str] | None = None,
 ) -> list[dict[str, float]]:
     """Batch RAGAS 0.4.x evaluation using direct per-metric batch_score() calls.
 
@@ -239,10 +257,7 @@ def compute_ragas_metrics_batch(
     individually via its batch_score() method with metric-specific input dicts.
     """
     if metric_names is None:
-        metric_names = [
-            "context_recall", "context_precision", "faithfulness",
-            "answer_correctness", "answer_relevancy",
-        ]
+        metric_names = _DEFAULT_RAGAS_METRICS
 
     n = len(queries)
     defaults = [{m: 0.0 for m in metric_names} for _ in range(n)]
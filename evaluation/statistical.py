@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     metric_name: str
     system_a_name: str
@@ -26,11 +27,20 @@ class ComparisonResult:
     corrected_significant: bool
 
 
-def paired_wilcoxon(a: list[float], b: list[float]) -> float:
+def _paired_diffs(a: Sequence[float] | np.ndarray, b: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Element-wise a - b for paired samples, which must have one score per query on each side."""
+    a_arr = np.asarray(a, dtype=float)
+    b_arr = np.asarray(b, dtype=float)
+    if len(a_arr) != len(b_arr):
+        raise ValueError(f"Paired samples must have equal length, got {len(a_arr)} and {len(b_arr)}")
+    return a_arr - b_arr
+
+
+def paired_wilcoxon(a: Sequence[float] | np.ndarray, b: Sequence[float] | np.ndarray) -> float:
     """Paired Wilcoxon signed-rank test. Returns p-value."""
     from scipy.stats import wilcoxon
-    diffs = [ai - bi for ai, bi in zip(a, b)]
-    if all(d == 0 for d in diffs):
+    diffs = _paired_diffs(a, b)
+    if not diffs.any():
         return 1.0
     try:
         _, p = wilcoxon(diffs, alternative="greater")
@@ -39,18 +49,19 @@ def paired_wilcoxon(a: list[float], b: list[float]) -> float:
         return 1.0
 
 
-def cohens_d(a: list[float], b: list[float]) -> float:
+def cohens_d(a: Sequence[float] | np.ndarray, b: Sequence[float] | np.ndarray) -> float:
     """Cohen's d effect size for paired samples."""
-    diffs = np.array([ai - bi for ai, bi in zip(a, b)])
-    if diffs.std() == 0:
+    diffs = _paired_diffs(a, b)
+    std = diffs.std()
+    if std == 0:
         return 0.0
-    return float(diffs.mean() / diffs.std())
+    return float(diffs.mean() / std)
 
 
-def confidence_interval_95(values: list[float]) -> tuple[float, float]:
+def confidence_interval_95(values: Sequence[float] | np.ndarray) -> tuple[float, float]:
     """95% confidence interval using t-distribution."""
     from scipy.stats import t as t_dist
-    arr = np.array(values)
+    arr = np.asarray(values, dtype=float)
     n = len(arr)
     if n < 2:
         return (arr.mean(), arr.mean())
@@ -84,14 +95,17 @@ def compare_systems(
     alpha: float = 0.05,
 ) -> ComparisonResult:
     """Full statistical comparison between two systems on one metric."""
-    a_mean = np.mean(system_a_scores)
-    b_mean = np.mean(system_b_scores)
-    a_std = np.std(system_a_scores, ddof=1) if len(system_a_scores) > 1 else 0.0
-    b_std = np.std(system_b_scores, ddof=1) if len(system_b_scores) > 1 else 0.0
-    a_ci = confidence_interval_95(system_a_scores)
-    b_ci = confidence_interval_95(system_b_scores)
-    p = paired_wilcoxon(system_b_scores, system_a_scores)
-    d = cohens_d(system_b_scores, system_a_scores)
+    # Convert once; the helpers below take the arrays without copying
+    a_arr = np.asarray(system_a_scores, dtype=float)
+    b_arr = np.asarray(system_b_scores, dtype=float)
+    a_mean = a_arr.mean()
+    b_mean = b_arr.mean()
+    a_std = a_arr.std(ddof=1) if len(a_arr) > 1 else 0.0
+    b_std = b_arr.std(ddof=1) if len(b_arr) > 1 else 0.0
+    a_ci = confidence_interval_95(a_arr)
+    b_ci = confidence_interval_95(b_arr)
+    p = paired_wilcoxon(b_arr, a_arr)
+    d = cohens_d(b_arr, a_arr)
 
     return ComparisonResult(
         metric_name=metric_name,
@@ -7,7 +7,7 @@ import time
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     text: str
     prompt_tokens: int = 0
@@ -24,6 +24,7 @@ class LLMClient:
         self.provider = provider
         self.model = model
         self._client = None
+        self._gemini_model = None
 
     def _get_openai_client(self):
         if self._client is None:
@@ -31,8 +32,15 @@ class LLMClient:
             self._client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         return self._client
 
+    def _get_gemini_model(self):
+        if self._gemini_model is None:
+            import google.generativeai as genai
+            genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+            self._gemini_model = genai.GenerativeModel(self.model)
+        return self._gemini_model
+
     def generate(self, prompt: str, system_prompt: str = "", max_tokens: int = 1024, temperature: float = 0.1) -> LLMResponse:
-        start = time.time()
+        start = time.perf_counter()
 
         if self.provider == "openai":
             return self._generate_openai(prompt, system_prompt, max_tokens, temperature, start)
@@ -54,7 +62,7 @@ class LLMClient:
             max_tokens=max_tokens,
             temperature=temperature,
         )
-        latency = time.time() - start
+        latency = time.perf_counter() - start
         usage = resp.usage
         return LLMResponse(
             text=resp.choices[0].message.content or "",
@@ -66,12 +74,10 @@ class LLMClient:
         )
 
     def _generate_gemini(self, prompt, system_prompt, max_tokens, temperature, start) -> LLMResponse:
-        import google.generativeai as genai
-        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-        model = genai.GenerativeModel(self.model)
+        model = self._get_gemini_model()
         full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
         resp = model.generate_content(full_prompt)
-        latency = time.time() - start
+        latency = time.perf_counter() - start
         return LLMResponse(
             text=resp.text or "",
             prompt_tokens=0,
@@ -62,26 +62,35 @@ FM_CROSS_REF_PATTERNS = [
     r"\((?:FM|ATP|ADP|AR|JP)\s+[\d\-]+\)",
 ]
 
+_ENTITY_REGEXES: list[tuple[str, re.Pattern[str]]] = [
+    (etype, re.compile(pattern, re.IGNORECASE))
+    for etype, patterns in MILITARY_ENTITY_PATTERNS.items()
+    for pattern in patterns
+]
+_CROSS_REF_REGEXES: list[re.Pattern[str]] = [
+    re.compile(pattern, re.IGNORECASE) for pattern in FM_CROSS_REF_PATTERNS
+]
+_TARGET_FM_RE = re.compile(r"(FM|ATP|ADP|AR|JP)\s+([\d\-]+)", re.IGNORECASE)
+
 
 def extract_entities(text: str) -> tuple[list[str], dict[str, str]]:
     """Extract military entities from text. Returns (entity_list, entity_type_map)."""
     entities = []
     entity_types = {}
-    for etype, patterns in MILITARY_ENTITY_PATTERNS.items():
-        for pattern in patterns:
-            for m in re.finditer(pattern, text, re.IGNORECASE):
-                ent = m.group(0).strip().lower()
-                if ent not in entity_types:
-                    entities.append(ent)
-                    entity_types[ent] = etype
+    for etype, regex in _ENTITY_REGEXES:
+        for m in regex.finditer(text):
+            ent = m.group(0).strip().lower()
+            if ent not in entity_types:
+                entities.append(ent)
+                entity_types[ent] = etype
     return entities, entity_types
 
 
 def extract_cross_references(text: str) -> list[str]:
     """Extract cross-reference mentions (e.g., 'See FM 3-0', 'per ADP 6-0')."""
     refs = []
-    for pattern in FM_CROSS_REF_PATTERNS:
-        for m in re.finditer(pattern, text, re.IGNORECASE):
+    for regex in _CROSS_REF_REGEXES:
+        for m in regex.finditer(text):
             refs.append(m.group(0).strip())
     return refs
 
@@ -150,26 +159,30 @@ def build_graph_edges(nodes: list[GraphNode], config: Optional[dict] = None) ->
                     weight=weight, evidence=ent,
                 ))
 
+    # Index nodes by source document once so each cross-reference only visits its target FM
+    nodes_by_source: dict[str, list[GraphNode]] = {}
+    for node in nodes:
+        nodes_by_source.setdefault(node.chunk.source_document, []).append(node)
+
     for node in nodes:
         cross_refs = extract_cross_references(node.chunk.text)
         for ref in cross_refs:
-            fm_match = re.search(r"(FM|ATP|ADP|AR|JP)\s+([\d\-]+)", ref, re.IGNORECASE)
+            fm_match = _TARGET_FM_RE.search(ref)
             if not fm_match:
                 continue
             target_fm = f"{fm_match.group(1).upper()} {fm_match.group(2)}"
-            for other in nodes:
+            for other in nodes_by_source.get(target_fm, ()):
                 if other.id == node.id:
                     continue
-                if other.chunk.source_document == target_fm:
-                    pair = (min(node.id, other.id), max(node.id, other.id))
-                    if pair not in edge_set:
-                        edge_set.add(pair)
-                        edges.append(GraphEdge(
-                            source=node.id, target=other.id,
-                            relation=f"cross_reference:{ref}",
-                            weight=1.5,
-                            evidence=ref,
-                        ))
+                pair = (min(node.id, other.id), max(node.id, other.id))
+                if pair not in edge_set:
+                    edge_set.add(pair)
+                    edges.append(GraphEdge(
+                        source=node.id, target=other.id,
+                        relation=f"cross_reference:{ref}",
+                        weight=1.5,
+                        evidence=ref,
+                    ))
 
     for i in range(len(nodes) - 1):
         src, tgt = nodes[i], nodes[i + 1]
@@ -4,38 +4,52 @@ from __future__ import annotations
 
 import re
 import time
-from typing import Optional
+from collections import OrderedDict
+from typing import Mapping, Optional
 
 import numpy as np
 
 from core.data_models import DocumentChunk, RetrievalResult
 from core.embeddings import EmbeddingModel
+from graph.entity_extractor import extract_entities
 from graph.knowledge_graph import KnowledgeGraph
 from retrieval.vector_store import VectorStore
 
 
+_COMPOUND_SPLIT_RE = re.compile(r"\band\b|;", re.IGNORECASE)
+# Doctrine terms (group 1) and FM/doctrine refs (group 2) found in a single scan
+_QUERY_TERM_OR_REF_RE = re.compile(
+    r"\b(mission command|multidomain operations|convergence|relative advantage|"
+    r"operational reach|decisive point|defeat mechanism|combat power|"
+    r"warfighting function|area of operations|main effort|reserve)\b"
+    r"|((?:FM|ATP|ADP)\s+[\d\-]+)",
+    re.IGNORECASE,
+)
+
+
 def _decompose_query(query: str) -> list[str]:
     """Rule-based query decomposition into sub-questions for subquery coverage scoring."""
     subqueries = [query]
 
     # Split compound questions joined by "and" or ";"
-    parts = re.split(r"\band\b|;", query, flags=re.IGNORECASE)
+    parts = _COMPOUND_SPLIT_RE.split(query)
     if len(parts) > 1:
         subqueries = [p.strip() for p in parts if len(p.strip()) > 10]
 
+    terms: list[str] = []
+    fm_refs: list[str] = []
+    for m in _QUERY_TERM_OR_REF_RE.finditer(query):
+        if m.group(1):
+            terms.append(m.group(1))
+        else:
+            fm_refs.append(m.group(2))
+
     # Generate definition/requirement subqueries for key doctrine terms
-    terms = re.findall(
-        r"\b(?:mission command|multidomain operations|convergence|relative advantage|"
-        r"operational reach|decisive point|defeat mechanism|combat power|"
-        r"warfighting function|area of operations|main effort|reserve)\b",
-        query, re.IGNORECASE,
-    )
     for term in terms:
         subqueries.append(f"What is {term}?")
         subqueries.append(f"What are the requirements for {term}?")
 
-    # Extract FM/doctrine cross-refs and generate subqueries for them
-    fm_refs = re.findall(r"(?:FM|ATP|ADP)\s+[\d\-]+", query, re.IGNORECASE)
+    # Generate subqueries for FM/doctrine cross-refs
     for ref in fm_refs:
         subqueries.append(f"What does {ref} say about this topic?")
 
@@ -45,6 +59,12 @@ def _decompose_query(query: str) -> list[str]:
 class CSSConfig:
     """Constitutional Search Space optimization weights."""
 
+    __slots__ = (
+        "relevance", "context_cohesion", "subquery_coverage", "cross_ref_bonus",
+        "entity_overlap", "temporal_recency", "token_budget", "redundancy_threshold",
+        "source_diversity_penalty",
+    )
+
     def __init__(
         self,
         relevance: float = 2.0,
@@ -56,7 +76,6 @@ class CSSConfig:
         token_budget: int = 3000,
         redundancy_threshold: float = 0.92,
         source_diversity_penalty: float = 0.35,
-        bridge_degree_threshold: int = 3,
     ):
         self.relevance = relevance
         self.context_cohesion = context_cohesion
@@ -67,7 +86,6 @@ class CSSConfig:
         self.token_budget = token_budget
         self.redundancy_threshold = redundancy_threshold
         self.source_diversity_penalty = source_diversity_penalty
-        self.bridge_degree_threshold = bridge_degree_threshold
 
 
 class GraphRetriever:
@@ -83,6 +101,7 @@ class GraphRetriever:
         max_hops: int = 2,
         final_top_k: int = 10,
         graph_bypass_threshold: float = 0.65,
+        embedding_cache_size: int = 10000,
     ):
         self.vector_store = vector_store
         self.kg = knowledge_graph
@@ -92,9 +111,12 @@ class GraphRetriever:
         self.max_hops = max_hops
         self.final_top_k = final_top_k
         self.graph_bypass_threshold = graph_bypass_threshold
+        # Chunk embeddings don't depend on the query; keep the most recently used ones (LRU)
+        self.embedding_cache_size = embedding_cache_size
+        self._chunk_vec_cache: OrderedDict[str, np.ndarray] = OrderedDict()
 
-    def retrieve(self, query: str, temporal_weights: dict[str, float] | None = None) -> RetrievalResult:
-        start = time.time()
+    def retrieve(self, query: str, temporal_weights: Mapping[str, float] | None = None) -> RetrievalResult:
+        start = time.perf_counter()
 
         initial = self.vector_store.search(query, top_k=self.initial_top_k)
         seed_ids = [c.id for c in initial.chunks]
@@ -147,7 +169,7 @@ class GraphRetriever:
                 chunks.append(node.chunk)
                 scores.append(score)
 
-        latency = time.time() - start
+        latency = time.perf_counter() - start
         return RetrievalResult(
             chunks=chunks,
             scores=scores,
@@ -161,10 +183,9 @@ class GraphRetriever:
         self,
         query: str,
         candidate_ids: dict[str, float],
-        temporal_weights: dict[str, float] | None = None,
+        temporal_weights: Mapping[str, float] | None = None,
     ) -> list[tuple[str, float]]:
         """Score candidates using CSS-style multi-factor optimization."""
-        from graph.entity_extractor import extract_entities
         ents, _ = extract_entities(query)
         query_entities = set(ents)
 
@@ -178,33 +199,52 @@ class GraphRetriever:
         if not valid:
             return []
 
-        # Batch-encode query, subqueries, and all candidate chunks in three calls
+        # Batch-encode query, subqueries, and uncached candidate chunks in one call
         # instead of one encode_single() per candidate (was the 368s/query bottleneck).
-        all_texts = [query] + subqueries + [node.chunk.text for _, _, node in valid]
+        vec_cache = self._chunk_vec_cache
+        chunk_vecs: dict[str, np.ndarray] = {}
+        missing = []
+        for nid, _, node in valid:
+            if nid in vec_cache:
+                vec_cache.move_to_end(nid)
+                chunk_vecs[nid] = vec_cache[nid]
+            else:
+                missing.append((nid, node))
+        all_texts = [query] + subqueries + [node.chunk.text for _, node in missing]
         all_vecs = self.embedding_model.encode(all_texts)
 
         query_vec = all_vecs[0]
         subquery_vecs = all_vecs[1: 1 + len(subqueries)]
-        chunk_vecs = all_vecs[1 + len(subqueries):]   # one vector per valid candidate
-
+        for j, (nid, _) in enumerate(missing):
+            # Copy so a cached row doesn't pin the whole batch array in memory
+            vec = all_vecs[1 + len(subqueries) + j].copy()
+            chunk_vecs[nid] = vec
+            vec_cache[nid] = vec
+        while len(vec_cache) > self.embedding_cache_size:
+            vec_cache.popitem(last=False)
+
+        # Similarities for all candidates in two matrix products instead of per-chunk dots
+        chunk_mat = np.stack([chunk_vecs[nid] for nid, _, _ in valid])
+        relevances = chunk_mat @ query_vec
+        # Subquery coverage: avg cosine similarity across decomposed subqueries
+        coverages = (chunk_mat @ subquery_vecs.T).mean(axis=1)
+
+        graph_adj = self.kg.graph.adj
         scored = []
         for i, (nid, base_score, node) in enumerate(valid):
-            chunk_vec = chunk_vecs[i]
-
-            relevance = float(np.dot(query_vec, chunk_vec))
-
-            # Subquery coverage: avg cosine similarity across decomposed subqueries
-            subquery_coverage = float(np.mean(subquery_vecs @ chunk_vec))
+            relevance = float(relevances[i])
+            subquery_coverage = float(coverages[i])
 
-            shared_entities = query_entities & set(node.entities)
-            union_entities = query_entities | set(node.entities)
+            node_entities = set(node.entities)
+            shared_entities = query_entities & node_entities
+            union_entities = query_entities | node_entities
             entity_score = len(shared_entities) / max(len(union_entities), 1)
 
-            is_cross_ref = any(
-                self.kg.graph[nid].get(neighbor, {}).get("relation", "").startswith("cross_reference")
-                for neighbor in self.kg.graph.neighbors(nid)
-                if self.kg.graph.has_edge(nid, neighbor)
-            ) if nid in self.kg.graph else False
+            adjacency = graph_adj.get(nid)
+            is_cross_ref = adjacency is not None and any(
+                attrs.get("relation", "").startswith("cross_reference")
+                for attrs in adjacency.values()
+            )
 
             temporal_w = 1.0
             if temporal_weights and nid in temporal_weights:
@@ -224,26 +264,18 @@ class GraphRetriever:
         return scored
 
     def _is_protected(self, nid: str) -> bool:
-        """V3-inspired protection layers: cross-ref nodes and high-degree bridges are preserved.
+        """V3-inspired protection layer: nodes on a cross-reference edge are preserved.
 
         Adapted from CSS_graph_project/transforms/prune.py (Layers 1-2): structural edges
-        (cross_reference) and high-degree bridges should not be dropped by diversity/redundancy
-        filters, since they carry multi-hop routing value that a hard cap blindly discards.
+        (cross_reference) should not be dropped by diversity/redundancy filters, since they
+        carry multi-hop routing value that a hard cap blindly discards.
         """
         if nid not in self.kg.graph:
             return False
-        neighbors = list(self.kg.graph.neighbors(nid))
-        for nb in neighbors:
-            if self.kg.graph.has_edge(nid, nb):
-                relation = self.kg.graph[nid][nb].get("relation", "")
-                if relation.startswith("cross_reference"):
-                    return True
-        if len(neighbors) >= self.css.bridge_degree_threshold:
-            for nb in neighbors:
-                if self.kg.graph.has_edge(nid, nb):
-                    if self.kg.graph[nid][nb].get("relation", "").startswith("cross_reference"):
-                        return True
-        return False
+        return any(
+            attrs.get("relation", "").startswith("cross_reference")
+            for attrs in self.kg.graph[nid].values()
+        )
 
     def _enforce_source_diversity(self, scored: list[tuple[str, float]]) -> list[tuple[str, float]]:
         """Soft diversity penalty (V3-style) instead of a hard per-source cap.
@@ -252,7 +284,7 @@ class GraphRetriever:
         caused the evidence-recall regression (0.392 vs 0.894). V3's prune operator uses
         graded penalties with structural-node protection instead. Here we apply a multiplicative
         penalty that grows with same-source repetition, and skip the penalty for protected
-        (cross-reference / bridge) nodes so multi-hop routing chunks survive.
+        (cross-reference) nodes so multi-hop routing chunks survive.
         """
         source_counts: dict[str, int] = {}
         adjusted: list[tuple[str, float]] = []
@@ -269,30 +301,33 @@ class GraphRetriever:
         return adjusted
 
     def _remove_redundant(self, scored: list[tuple[str, float]]) -> list[tuple[str, float]]:
-        """Remove near-duplicates, protecting cross-reference / bridge nodes (V3 Layer 1-2)."""
+        """Remove near-duplicates, protecting cross-reference nodes (V3 Layer 1-2)."""
         if not scored:
             return scored
 
+        # Token sets are built once per chunk instead of once per pairwise comparison
         kept = [scored[0]]
-        kept_texts = [self.kg.get_node(scored[0][0]).chunk.text if self.kg.get_node(scored[0][0]) else ""]
+        first = self.kg.get_node(scored[0][0])
+        kept_tokens = [set(first.chunk.text.split()) if first else set()]
 
         for nid, score in scored[1:]:
             node = self.kg.get_node(nid)
             if not node:
                 continue
+            tokens = set(node.chunk.text.split())
             if self._is_protected(nid):
                 kept.append((nid, score))
-                kept_texts.append(node.chunk.text)
+                kept_tokens.append(tokens)
                 continue
-            text = node.chunk.text
+            denom = max(len(tokens), 1)
             is_redundant = False
-            for kt in kept_texts:
-                overlap = len(set(text.split()) & set(kt.split())) / max(len(set(text.split())), 1)
+            for kt in kept_tokens:
+                overlap = len(tokens & kt) / denom
                 if overlap > self.css.redundancy_threshold:
                     is_redundant = True
                     break
             if not is_redundant:
                 kept.append((nid, score))
-                kept_texts.append(text)
+                kept_tokens.append(tokens)
 
         return kept
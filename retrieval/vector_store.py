@@ -28,21 +28,48 @@ class VectorStore:
         embeddings = self.embedding_model.encode(texts, batch_size=batch_size)
         dim = embeddings.shape[1]
         self.index = self._faiss.IndexFlatIP(dim)
-        self.index.add(embeddings.astype(np.float32))
+        self.index.add(embeddings.astype(np.float32, copy=False))
 
     def search(self, query: str, top_k: int = 10, threshold: float = 0.0) -> RetrievalResult:
         if self.index is None:
             raise RuntimeError("Vector store not built. Call build() first.")
 
         import time
-        start = time.time()
-        query_vec = self.embedding_model.encode_single(query).reshape(1, -1).astype(np.float32)
+        start = time.perf_counter()
+        query_vec = self.embedding_model.encode_single(query).reshape(1, -1).astype(np.float32, copy=False)
         scores, indices = self.index.search(query_vec, top_k)
-        latency = time.time() - start
+        latency = time.perf_counter() - start
 
+        return self._to_result(scores[0], indices[0], latency, threshold)
+
+    def search_batch(self, queries: list[str], top_k: int = 10, threshold: float = 0.0) -> list[RetrievalResult]:
+        """Search many queries with one encode call and one FAISS search.
+
+        Each result reports the measured latency of the whole batch call.
+        """
+        if self.index is None:
+            raise RuntimeError("Vector store not built. Call build() first.")
+        if not queries:
+            return []
+
+        import time
+        start = time.perf_counter()
+        query_vecs = self.embedding_model.encode(queries).astype(np.float32, copy=False)
+        scores, indices = self.index.search(query_vecs, top_k)
+        latency = time.perf_counter() - start
+
+        return [
+            self._to_result(row_scores, row_indices, latency, threshold)
+            for row_scores, row_indices in zip(scores, indices)
+        ]
+
+    def _to_result(
+        self, row_scores: np.ndarray, row_indices: np.ndarray, latency: float, threshold: float = 0.0
+    ) -> RetrievalResult:
+        """Turn one row of FAISS output into a RetrievalResult, skipping padding and low scores."""
         result_chunks = []
         result_scores = []
-        for score, idx in zip(scores[0], indices[0]):
+        for score, idx in zip(row_scores, row_indices):
             if idx < 0 or score < threshold:
                 continue
             result_chunks.append(self.chunks[idx])
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import pickle
 import sys
+from collections import Counter
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
 
 from dotenv import load_dotenv
-load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+load_dotenv(ROOT / ".env")
 
 from core.config_loader import load_config
 from core.document_processor import load_corpus
@@ -18,8 +20,8 @@ from graph.knowledge_graph import KnowledgeGraph
 
 def main():
     config = load_config()
-    corpus_dir = Path(__file__).resolve().parent.parent / "data" / "corpus"
-    graph_dir = Path(__file__).resolve().parent.parent / "data" / "graph"
+    corpus_dir = ROOT / "data" / "corpus"
+    graph_dir = ROOT / "data" / "graph"
     graph_dir.mkdir(parents=True, exist_ok=True)
 
     print("Loading corpus...")
@@ -40,22 +42,21 @@ def main():
     print(f"Graph: {kg.num_nodes} nodes, {kg.num_edges} edges")
     print(f"Connectivity: {kg.connectivity:.2%} of nodes in largest component")
 
-    entity_counts = {}
-    for node in kg.nodes.values():
-        for etype in node.entity_types.values():
-            entity_counts[etype] = entity_counts.get(etype, 0) + 1
+    entity_counts = Counter(
+        etype for node in kg.nodes.values() for etype in node.entity_types.values()
+    )
 
     print("\nEntity type distribution:")
-    for etype, count in sorted(entity_counts.items(), key=lambda x: -x[1]):
+    for etype, count in entity_counts.most_common():
         print(f"  {etype}: {count}")
 
-    edge_types = {}
-    for u, v, data in kg.graph.edges(data=True):
-        rel = data.get("relation", "unknown").split(":")[0]
-        edge_types[rel] = edge_types.get(rel, 0) + 1
+    edge_types = Counter(
+        data.get("relation", "unknown").split(":")[0]
+        for _, _, data in kg.graph.edges(data=True)
+    )
 
     print("\nEdge type distribution:")
-    for etype, count in sorted(edge_types.items(), key=lambda x: -x[1]):
+    for etype, count in edge_types.most_common():
         print(f"  {etype}: {count}")
 
     print(f"\nSaving graph to {graph_dir}")
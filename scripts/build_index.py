@@ -5,10 +5,11 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
 
 from dotenv import load_dotenv
-load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+load_dotenv(ROOT / ".env")
 
 from core.config_loader import load_config
 from core.document_processor import load_corpus
@@ -19,8 +20,8 @@ from retrieval.vector_store import VectorStore
 def main():
     config = load_config()
 
-    corpus_dir = Path(__file__).resolve().parent.parent / "data" / "corpus"
-    index_dir = Path(__file__).resolve().parent.parent / "data" / "index"
+    corpus_dir = ROOT / "data" / "corpus"
+    index_dir = ROOT / "data" / "index"
 
     print(f"Loading corpus from {corpus_dir}")
     chunks = load_corpus(
@@ -13,12 +13,14 @@ from __future__ import annotations
 import json
 import pickle
 import sys
+from collections import Counter
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
 
 from dotenv import load_dotenv
-load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+load_dotenv(ROOT / ".env")
 
 
 def _print(msg: str) -> None:
@@ -31,9 +33,8 @@ def main():
     from graph.knowledge_graph import KnowledgeGraph
 
     config = load_config()
-    root = Path(__file__).resolve().parent.parent
-    graph_dir = root / "data" / "graph"
-    results_dir = root / "data" / "results"
+    graph_dir = ROOT / "data" / "graph"
+    results_dir = ROOT / "data" / "results"
     results_dir.mkdir(parents=True, exist_ok=True)
 
     _print("=" * 60)
@@ -53,9 +54,11 @@ def main():
     _print("\n--- Graph Connectivity ---")
     n_nodes = kg.num_nodes
     n_edges = kg.num_edges
-    connectivity = kg.connectivity
-    n_components = nx.number_connected_components(kg.graph)
-    largest_cc = max(nx.connected_components(kg.graph), key=len) if n_nodes > 0 else set()
+    # One component traversal feeds the count, largest component and connectivity ratio
+    components = list(nx.connected_components(kg.graph))
+    n_components = len(components)
+    largest_cc = max(components, key=len) if n_nodes > 0 else set()
+    connectivity = len(largest_cc) / n_nodes if n_nodes > 0 else 0.0
 
     _print(f"  Nodes: {n_nodes}")
     _print(f"  Edges: {n_edges}")
@@ -75,34 +78,30 @@ def main():
 
     # --- Entity Type Distribution ---
     _print("\n--- Entity Type Distribution ---")
-    entity_counts: dict[str, int] = {}
-    total_entities = 0
-    for node in kg.nodes.values():
-        for etype in node.entity_types.values():
-            entity_counts[etype] = entity_counts.get(etype, 0) + 1
-            total_entities += 1
-
-    for etype, count in sorted(entity_counts.items(), key=lambda x: -x[1]):
+    entity_counts = Counter(
+        etype for node in kg.nodes.values() for etype in node.entity_types.values()
+    )
+    total_entities = sum(entity_counts.values())
+
+    for etype, count in entity_counts.most_common():
         _print(f"  {etype}: {count} ({count/max(total_entities,1)*100:.1f}%)")
     _print(f"  Total entity mentions: {total_entities}")
 
-    report["entity_distribution"] = entity_counts
+    report["entity_distribution"] = dict(entity_counts)
     report["total_entity_mentions"] = total_entities
 
     # --- Edge Type Distribution ---
     _print("\n--- Edge Type Distribution ---")
-    edge_types: dict[str, int] = {}
-    cross_ref_edges = 0
-    for u, v, data in kg.graph.edges(data=True):
-        rel = data.get("relation", "unknown").split(":")[0]
-        edge_types[rel] = edge_types.get(rel, 0) + 1
-        if rel == "cross_reference":
-            cross_ref_edges += 1
-
-    for etype, count in sorted(edge_types.items(), key=lambda x: -x[1]):
+    edge_types = Counter(
+        data.get("relation", "unknown").split(":")[0]
+        for _, _, data in kg.graph.edges(data=True)
+    )
+    cross_ref_edges = edge_types["cross_reference"]
+
+    for etype, count in edge_types.most_common():
         _print(f"  {etype}: {count}")
 
-    report["edge_distribution"] = edge_types
+    report["edge_distribution"] = dict(edge_types)
     report["cross_reference_edges"] = cross_ref_edges
 
     # --- Cross-Document Edges ---
@@ -122,15 +121,12 @@ def main():
 
     # --- Per-FM Statistics ---
     _print("\n--- Per-FM Node Distribution ---")
-    fm_node_counts: dict[str, int] = {}
-    for node in kg.nodes.values():
-        fm = node.chunk.source_document
-        fm_node_counts[fm] = fm_node_counts.get(fm, 0) + 1
+    fm_node_counts = Counter(node.chunk.source_document for node in kg.nodes.values())
 
     for fm, count in sorted(fm_node_counts.items()):
         _print(f"  {fm}: {count} nodes ({count/max(n_nodes,1)*100:.1f}%)")
 
-    report["per_fm_nodes"] = fm_node_counts
+    report["per_fm_nodes"] = dict(fm_node_counts)
 
     # --- Graph Density ---
     _print("\n--- Graph Density ---")
@@ -6,10 +6,11 @@ import json
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
 
 from dotenv import load_dotenv
-load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+load_dotenv(ROOT / ".env")
 
 from core.config_loader import load_config
 from core.embeddings import EmbeddingModel
@@ -26,8 +27,8 @@ def _print(msg: str) -> None:
 
 def main():
     config = load_config()
-    index_dir = Path(__file__).resolve().parent.parent / "data" / "index"
-    results_dir = Path(__file__).resolve().parent.parent / "data" / "results"
+    index_dir = ROOT / "data" / "index"
+    results_dir = ROOT / "data" / "results"
     results_dir.mkdir(parents=True, exist_ok=True)
 
     _print("Loading vector store...")
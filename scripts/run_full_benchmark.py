@@ -7,15 +7,17 @@ Produces: benchmark_report.md, benchmark_report.json with LaTeX tables, per-FM b
 from __future__ import annotations
 
 import json
+import os
 import pickle
 import sys
 import time
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
 
 from dotenv import load_dotenv
-load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+load_dotenv(ROOT / ".env")
 
 
 def _print(msg: str) -> None:
@@ -44,20 +46,46 @@ def _safe_query(system, question: str, **kwargs):
 
 
 def _load_checkpoint(path: Path) -> dict:
-    if not path.exists():
-        return {}
-    try:
-        with open(path, "rb") as f:
-            return pickle.load(f)
-    except Exception:
-        return {}
-
+    """Replay the checkpoint stream: an optional full dict snapshot, then (key, gen) records.
 
-def _save_checkpoint(path: Path, data: dict) -> None:
-    tmp = path.with_suffix(".pkl.tmp")
-    with open(tmp, "wb") as f:
-        pickle.dump(data, f)
-    tmp.replace(path)
+    A torn record left by an interrupted write is cut off so later appends stay readable.
+    Any other unreadable record raises rather than discarding the records after it.
+    """
+    cp: dict = {}
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        return cp
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        good_end = 0
+        while good_end < size:
+            try:
+                record = pickle.load(f)
+            except (EOFError, pickle.UnpicklingError):
+                if f.tell() < size:  # unreadable record with data after it: not a torn tail
+                    raise
+                break
+            if isinstance(record, dict):
+                cp.update({key: list(value) for key, value in record.items()})
+            else:
+                key, gen = record
+                cp.setdefault(key, []).append(gen)
+            good_end = f.tell()
+        if good_end < size:
+            f.truncate(good_end)
+    return cp
+
+
+def _append_checkpoint(path: Path, key: str, gen) -> None:
+    """Append one generation as a single pickled record instead of rewriting the checkpoint."""
+    with open(path, "ab") as f:
+        f.write(pickle.dumps((key, gen)))
+
+
+def _reset_checkpoint(path: Path) -> None:
+    """Empty the checkpoint so a --fresh run does not replay records from an earlier run."""
+    path.write_bytes(b"")
 
 
 def main():
@@ -86,12 +114,13 @@ def main():
     args = parser.parse_args()
 
     config = load_config()
-    root = Path(__file__).resolve().parent.parent
-    index_dir = root / "data" / "index"
-    graph_dir = root / "data" / "graph"
-    results_dir = root / "data" / "results"
+    index_dir = ROOT / "data" / "index"
+    graph_dir = ROOT / "data" / "graph"
+    results_dir = ROOT / "data" / "results"
     results_dir.mkdir(parents=True, exist_ok=True)
     checkpoint_path = results_dir / "benchmark_checkpoint.pkl"
+    if args.fresh:
+        _reset_checkpoint(checkpoint_path)
     cp: dict = {} if args.fresh else _load_checkpoint(checkpoint_path)
 
     annotations = GOLD_ANNOTATIONS
@@ -138,8 +167,7 @@ def main():
             ann = annotations[i]
             _print(f"  [{i+1}/{n_queries}] {ann.id}")
             vanilla_gens.append(_safe_query(vanilla, ann.query))
-            cp["vanilla_gens"] = vanilla_gens
-            _save_checkpoint(checkpoint_path, cp)
+            _append_checkpoint(checkpoint_path, "vanilla_gens", vanilla_gens[-1])
     else:
         _print("  (skipped: loaded from checkpoint)")
 
@@ -162,8 +190,7 @@ def main():
             iterative_gens.append(
                 _safe_query(iterative, ann.query, information_checklist=ann.information_units)
             )
-            cp["iterative_gens"] = iterative_gens
-            _save_checkpoint(checkpoint_path, cp)
+            _append_checkpoint(checkpoint_path, "iterative_gens", iterative_gens[-1])
     else:
         _print("  (skipped: loaded from checkpoint)")
 
@@ -203,8 +230,7 @@ def main():
             ann = annotations[i]
             _print(f"  [{i+1}/{n_queries}] {ann.id}")
             sentinel_gens.append(_safe_query(sentinel, ann.query, enable_temporal=True))
-            cp["sentinel_gens"] = sentinel_gens
-            _save_checkpoint(checkpoint_path, cp)
+            _append_checkpoint(checkpoint_path, "sentinel_gens", sentinel_gens[-1])
     else:
         _print("  (skipped: loaded from checkpoint)")
 
@@ -222,8 +248,7 @@ def main():
             ann = annotations[i]
             _print(f"  [{i+1}/{n_queries}] {ann.id}")
             sentinel_no_decay_gens.append(_safe_query(sentinel, ann.query, enable_temporal=False))
-            cp["sentinel_no_decay_gens"] = sentinel_no_decay_gens
-            _save_checkpoint(checkpoint_path, cp)
+            _append_checkpoint(checkpoint_path, "sentinel_no_decay_gens", sentinel_no_decay_gens[-1])
     else:
         _print("  (skipped: loaded from checkpoint)")
 
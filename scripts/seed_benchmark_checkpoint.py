@@ -16,10 +16,11 @@ import pickle
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
 
 from dotenv import load_dotenv
-load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+load_dotenv(ROOT / ".env")
 
 
 def _format_vanilla_context(retrieval) -> str:
@@ -57,10 +58,9 @@ def main() -> None:
     from retrieval.vector_store import VectorStore
     from sentinel.temporal_decay import TemporalDecayEngine
 
-    root = Path(__file__).resolve().parent.parent
-    results_dir = root / "data" / "results"
-    index_dir = root / "data" / "index"
-    graph_dir = root / "data" / "graph"
+    results_dir = ROOT / "data" / "results"
+    index_dir = ROOT / "data" / "index"
+    graph_dir = ROOT / "data" / "graph"
     config = load_config()
     annotations = GOLD_ANNOTATIONS
     n = len(annotations)
@@ -122,9 +122,10 @@ def main() -> None:
     sentinel_gens: list[GenerationResult] = []
 
     print("Rebuilding generations (retrieval only, answers from JSON)...")
-    for ann in annotations:
+    # Vanilla and iterative share the same vector search, so run it once for all queries
+    vector_results = vs.search_batch([ann.query for ann in annotations], top_k=config.retrieval.top_k)
+    for ann, rr_v in zip(annotations, vector_results):
         vr = vanilla_rows[ann.id]
-        rr_v = vs.search(ann.query, top_k=config.retrieval.top_k)
         vanilla_gens.append(
             GenerationResult(
                 answer=vr["answer"],
@@ -140,12 +141,11 @@ def main() -> None:
         )
 
         ir = iterative_rows[ann.id]
-        rr_i = vs.search(ann.query, top_k=config.retrieval.top_k)
         iterative_gens.append(
             GenerationResult(
                 answer=ir["answer"],
-                retrieved_context=_format_vanilla_context(rr_i),
-                retrieval_result=rr_i,
+                retrieved_context=_format_vanilla_context(rr_v),
+                retrieval_result=rr_v,
                 prompt_tokens=ir.get("prompt_tokens", 0),
                 completion_tokens=ir.get("completion_tokens", 0),
                 total_tokens=ir.get("total_tokens", 0),
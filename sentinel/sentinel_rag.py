@@ -31,7 +31,7 @@ class SentinelRAG:
         self.top_k = top_k
 
     def query(self, question: str, enable_temporal: bool = True) -> GenerationResult:
-        start = time.time()
+        start = time.perf_counter()
 
         temporal_weights = None
         if enable_temporal and self.temporal_engine:
@@ -53,7 +53,7 @@ class SentinelRAG:
         )
         llm_resp = self.llm.generate(prompt, system_prompt=SENTINEL_RAG_SYSTEM)
 
-        total_latency = time.time() - start
+        total_latency = time.perf_counter() - start
         return GenerationResult(
             answer=llm_resp.text,
             retrieved_context=context,
@@ -77,18 +77,14 @@ class SentinelRAG:
         return "\n\n".join(parts)
 
     def _build_cross_ref_notes(self, retrieval: RetrievalResult) -> str:
-        docs = set()
-        sections = set()
-        for chunk in retrieval.chunks:
-            docs.add(chunk.source_document)
-            sections.add(f"{chunk.source_document} {chunk.section_id}")
+        docs = {chunk.source_document for chunk in retrieval.chunks}
 
         notes = []
         if len(docs) > 1:
             notes.append(f"Cross-document context from: {', '.join(sorted(docs))}")
         if retrieval.edges_traversed:
-            cross_doc_edges = [e for e in retrieval.edges_traversed if "xdoc" in e]
-            if cross_doc_edges:
-                notes.append(f"Cross-reference edges followed: {len(cross_doc_edges)}")
+            n_cross_doc = sum(1 for e in retrieval.edges_traversed if "xdoc" in e)
+            if n_cross_doc:
+                notes.append(f"Cross-reference edges followed: {n_cross_doc}")
         notes.append(f"Graph nodes explored: {len(retrieval.nodes_used)}")
         return "\n".join(notes) if notes else "Single-document retrieval."
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import math
+import weakref
 from datetime import datetime, timezone
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 
 from core.data_models import DocumentChunk
 
@@ -20,12 +22,60 @@ class TemporalDecayEngine:
         flag_stale: bool = True,
         reference_time: Optional[datetime] = None,
     ):
+        # Per-graph weights; weak keys so a discarded KnowledgeGraph drops its entry
+        self._weights_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._decay: Optional[Callable[[float], float]] = None
         self.decay_function = decay_function
         self.half_life_hours = half_life_hours
         self.stale_threshold_hours = stale_threshold_hours
         self.flag_stale = flag_stale
         self.reference_time = reference_time or datetime.now(timezone.utc)
 
+    @property
+    def decay_function(self) -> str:
+        return self._decay_function
+
+    @decay_function.setter
+    def decay_function(self, value: str) -> None:
+        self._decay_function = value
+        self._reset_decay()
+
+    @property
+    def half_life_hours(self) -> float:
+        return self._half_life_hours
+
+    @half_life_hours.setter
+    def half_life_hours(self, value: float) -> None:
+        self._half_life_hours = value
+        self._reset_decay()
+
+    @property
+    def stale_threshold_hours(self) -> float:
+        return self._stale_threshold_hours
+
+    @stale_threshold_hours.setter
+    def stale_threshold_hours(self, value: float) -> None:
+        self._stale_threshold_hours = value
+        self._reset_decay()
+
+    def _reset_decay(self) -> None:
+        """Drop the specialized curve and cached weights after a decay setting changes."""
+        self._decay = None
+        self._weights_cache.clear()
+
+    def _build_decay(self) -> Callable[[float], float]:
+        """Specialize the decay curve once so compute_weight skips the per-call dispatch."""
+        if self.decay_function == "exponential":
+            rate = math.log(2) / self.half_life_hours
+            return lambda age_hours: math.exp(-rate * age_hours)
+        if self.decay_function == "linear":
+            span = self.stale_threshold_hours * 2
+            return lambda age_hours: max(0.0, 1.0 - age_hours / span)
+        if self.decay_function == "step":
+            threshold = self.stale_threshold_hours
+            return lambda age_hours: 0.3 if age_hours > threshold else 1.0
+        return lambda age_hours: 1.0
+
     def compute_weight(self, timestamp: Optional[datetime]) -> float:
         """Compute temporal weight for a single timestamp. Returns 1.0 if no timestamp."""
         if timestamp is None:
@@ -37,14 +87,9 @@ class TemporalDecayEngine:
         age_hours = (self.reference_time - timestamp).total_seconds() / 3600.0
         if age_hours < 0:
             return 1.0
-
-        if self.decay_function == "exponential":
-            return math.exp(-math.log(2) * age_hours / self.half_life_hours)
-        elif self.decay_function == "linear":
-            return max(0.0, 1.0 - age_hours / (self.stale_threshold_hours * 2))
-        elif self.decay_function == "step":
-            return 0.3 if age_hours > self.stale_threshold_hours else 1.0
-        return 1.0
+        if self._decay is None:
+            self._decay = self._build_decay()
+        return self._decay(age_hours)
 
     def is_stale(self, timestamp: Optional[datetime]) -> bool:
         if timestamp is None:
@@ -54,12 +99,30 @@ class TemporalDecayEngine:
         age_hours = (self.reference_time - timestamp).total_seconds() / 3600.0
         return age_hours > self.stale_threshold_hours
 
-    def compute_weights(self, knowledge_graph) -> dict[str, float]:
-        """Compute temporal weights for all nodes in the knowledge graph."""
+    def compute_weights(self, knowledge_graph) -> Mapping[str, float]:
+        """Compute temporal weights for timestamped nodes in the knowledge graph.
+
+        Undated nodes always weigh 1.0, so they are left out and callers fall back to
+        1.0 for missing ids. A corpus without timestamps yields an empty dict.
+
+        The reference time is fixed per engine, so results are cached per graph and
+        reused until its node map is replaced or changes size, or a decay setting is
+        reassigned. Swapping a node under an existing id or editing a chunk timestamp in
+        place is not detected; use a fresh engine after such edits. The returned mapping
+        is shared and read-only.
+        """
+        nodes = knowledge_graph.nodes
+        cached = self._weights_cache.get(knowledge_graph)
+        if cached is not None and cached[0] is nodes and cached[1] == len(nodes):
+            return cached[2]
+
         weights = {}
-        for nid, node in knowledge_graph.nodes.items():
-            weights[nid] = self.compute_weight(node.chunk.timestamp)
-        return weights
+        for nid, node in nodes.items():
+            if node.chunk.timestamp is not None:
+                weights[nid] = self.compute_weight(node.chunk.timestamp)
+        view = MappingProxyType(weights)
+        self._weights_cache[knowledge_graph] = (nodes, len(nodes), view)
+        return view
 
     def flag_stale_chunks(self, chunks: list[DocumentChunk]) -> str:
         """Generate stale-info warnings for retrieved chunks."""
@@ -0,0 +1,65 @@
+"""Tests for the append-only benchmark checkpoint in scripts/run_full_benchmark.py."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+from scripts.run_full_benchmark import _append_checkpoint, _load_checkpoint, _reset_checkpoint
+
+
+def test_missing_checkpoint_loads_empty(tmp_path):
+    assert _load_checkpoint(tmp_path / "cp.pkl") == {}
+
+
+def test_snapshot_then_records_replayed(tmp_path):
+    path = tmp_path / "cp.pkl"
+    path.write_bytes(pickle.dumps({"vanilla_gens": ["v0"], "iterative_gens": ["i0"]}))
+    _append_checkpoint(path, "vanilla_gens", "v1")
+    _append_checkpoint(path, "sentinel_gens", "s0")
+
+    assert _load_checkpoint(path) == {
+        "vanilla_gens": ["v0", "v1"],
+        "iterative_gens": ["i0"],
+        "sentinel_gens": ["s0"],
+    }
+
+
+def test_torn_tail_truncated_and_appends_readable(tmp_path):
+    path = tmp_path / "cp.pkl"
+    _append_checkpoint(path, "vanilla_gens", "v0")
+    intact = path.stat().st_size
+    with open(path, "ab") as f:
+        f.write(pickle.dumps(("vanilla_gens", "v1"))[:-3])
+
+    assert _load_checkpoint(path) == {"vanilla_gens": ["v0"]}
+    assert path.stat().st_size == intact
+
+    _append_checkpoint(path, "vanilla_gens", "v2")
+    assert _load_checkpoint(path) == {"vanilla_gens": ["v0", "v2"]}
+
+
+def test_corrupt_middle_record_raises_without_truncating(tmp_path):
+    path = tmp_path / "cp.pkl"
+    _append_checkpoint(path, "vanilla_gens", "v0")
+    with open(path, "ab") as f:
+        f.write(b"\xffnot a pickle")
+    _append_checkpoint(path, "iterative_gens", "i0")
+    size = path.stat().st_size
+
+    with pytest.raises(pickle.UnpicklingError):
+        _load_checkpoint(path)
+    assert path.stat().st_size == size
+
+
+def test_reset_empties_checkpoint(tmp_path):
+    path = tmp_path / "cp.pkl"
+    _append_checkpoint(path, "vanilla_gens", "v0")
+
+    _reset_checkpoint(path)
+
+    assert path.stat().st_size == 0
+    assert _load_checkpoint(path) == {}
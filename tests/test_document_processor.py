@@ -0,0 +1,20 @@
+"""Tests for section detection in core/document_processor.py."""
+
+from __future__ import annotations
+
+from core.document_processor import _detect_section, _find_headings
+
+
+class TestSectionDetection:
+    def test_precomputed_headings_match_prefix_scan(self):
+        """Reusing _find_headings must give the same section as scanning text[:position]."""
+        text = "Chapter 1\nINTRODUCTION\n\n1-1. Purpose.\n\nChapter 2\nOFFENSE AND DEFENSE\n\n2-3. Tasks."
+        headings = _find_headings(text)
+        for position in range(len(text) + 1):
+            assert _detect_section(text, position, headings) == _detect_section(text[:position], position)
+
+    def test_heading_straddling_position_is_truncated(self):
+        """A heading cut by the position keeps only the title text before it."""
+        text = "Chapter 2\nOFFENSE AND DEFENSE\nbody"
+        position = text.index(" AND")
+        assert _detect_section(text, position, _find_headings(text)) == ("Chapter 2", "OFFENSE")
@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import math
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from core.data_models import DocumentChunk, GraphEdge, GraphNode
-from graph.entity_extractor import build_graph_edges, build_graph_nodes, extract_entities
+from core.embeddings import EmbeddingModel
+from graph.entity_extractor import (
+    build_graph_edges,
+    build_graph_nodes,
+    extract_cross_references,
+    extract_entities,
+)
 from graph.knowledge_graph import KnowledgeGraph
-from retrieval.graph_retriever import _decompose_query
+from retrieval.graph_retriever import CSSConfig, GraphRetriever, _decompose_query
+from retrieval.vector_store import VectorStore
+from sentinel.temporal_decay import TemporalDecayEngine
 
 
 # ---------------------------------------------------------------------------
@@ -26,43 +37,48 @@ def _make_node(id: str, text: str, source: str = "FM 3-0", section: str = "1-1",
     return GraphNode(id=id, chunk=chunk, entities=entities or [])
 
 
+def _make_retriever(kg: KnowledgeGraph, **kwargs) -> GraphRetriever:
+    """GraphRetriever over spec'd mocks; every text embeds to [1, 0]."""
+    mock_vs = MagicMock(spec=VectorStore)
+    mock_emb = MagicMock(spec=EmbeddingModel)
+    mock_emb.encode.side_effect = lambda texts: np.tile([1.0, 0.0], (len(texts), 1))
+    return GraphRetriever(mock_vs, kg, mock_emb, **kwargs)
+
+
 # ---------------------------------------------------------------------------
 # Fix #1 — BFS deduplication: each node appears once with best weight
 # ---------------------------------------------------------------------------
 
-class TestBFSDeduplication:
-    def test_node_appears_once(self):
-        """A node reachable via two paths should appear exactly once in results."""
-        kg = KnowledgeGraph()
-        # Build a diamond: A -> B, A -> C, B -> D, C -> D
-        for nid in ["A", "B", "C", "D"]:
-            kg.graph.add_node(nid)
-            kg.nodes[nid] = _make_node(nid, f"text {nid}")
+@pytest.fixture(scope="module")
+def diamond_kg() -> KnowledgeGraph:
+    """Diamond A -> B, A -> C, B -> D, C -> D; the C path carries the higher weights.
 
-        kg.graph.add_edge("A", "B", weight=0.5, relation="r", evidence="")
-        kg.graph.add_edge("A", "C", weight=0.9, relation="r", evidence="")
-        kg.graph.add_edge("B", "D", weight=0.5, relation="r", evidence="")
-        kg.graph.add_edge("C", "D", weight=0.9, relation="r", evidence="")
+    Built once per module; get_neighbors only reads the graph.
+    """
+    kg = KnowledgeGraph()
+    for nid in ["A", "B", "C", "D"]:
+        kg.graph.add_node(nid)
+        kg.nodes[nid] = _make_node(nid, f"text {nid}")
 
-        results = kg.get_neighbors("A", max_hops=2)
+    kg.graph.add_edge("A", "B", weight=0.5, relation="r", evidence="")
+    kg.graph.add_edge("A", "C", weight=0.9, relation="r", evidence="")
+    kg.graph.add_edge("B", "D", weight=0.5, relation="r", evidence="")
+    kg.graph.add_edge("C", "D", weight=0.9, relation="r", evidence="")
+    return kg
+
+
+class TestBFSDeduplication:
+    def test_node_appears_once(self, diamond_kg):
+        """A node reachable via two paths should appear exactly once in results."""
+        results = diamond_kg.get_neighbors("A", max_hops=2)
         node_ids = [nid for nid, _ in results]
 
         assert node_ids.count("D") == 1, "D should appear exactly once"
 
-    def test_best_weight_kept(self):
+    def test_best_weight_kept(self, diamond_kg):
         """The weight for a multi-path node should be the best degree-dampened weight."""
-        kg = KnowledgeGraph()
-        for nid in ["A", "B", "C", "D"]:
-            kg.graph.add_node(nid)
-            kg.nodes[nid] = _make_node(nid, f"text {nid}")
-
         # Path A->C->D uses higher edge weights so should produce higher dampened score
-        kg.graph.add_edge("A", "B", weight=0.5, relation="r", evidence="")
-        kg.graph.add_edge("A", "C", weight=0.9, relation="r", evidence="")
-        kg.graph.add_edge("B", "D", weight=0.5, relation="r", evidence="")
-        kg.graph.add_edge("C", "D", weight=0.9, relation="r", evidence="")
-
-        results = kg.get_neighbors("A", max_hops=2)
+        results = diamond_kg.get_neighbors("A", max_hops=2)
         d_weight = next(w for nid, w in results if nid == "D")
         c_weight = next(w for nid, w in results if nid == "C")
 
@@ -129,6 +145,23 @@ class TestCrossRefEdgesNoSharedEntities:
         assert cross_ref_edges, "Expected cross-reference edge"
         assert cross_ref_edges[0].weight == 1.5
 
+    def test_overlapping_cross_refs_all_found(self):
+        """A section ref whose trailing token is the next ref's trigger must not hide that ref."""
+        assert extract_cross_references("refer to Appendix IAW AR 350-1") == [
+            "IAW AR 350-1", "refer to Appendix IAW",
+        ]
+        assert extract_cross_references("see Section per FM 3-0") == [
+            "per FM 3-0", "see Section per",
+        ]
+
+    def test_overlapping_cross_ref_still_links_target(self):
+        citing_chunk = _make_chunk("c1", "see Section per FM 3-0", source="FM 6-0", section="2-1")
+        target_chunk = _make_chunk("c2", "Unrelated text about weather.", source="FM 3-0", section="1-1")
+
+        edges = build_graph_edges(build_graph_nodes([citing_chunk, target_chunk]))
+
+        assert any("cross_reference" in e.relation for e in edges)
+
 
 # ---------------------------------------------------------------------------
 # Fix #3 — Entity frequency threshold raised to 200
@@ -276,12 +309,6 @@ class TestJaccardEntityOverlap:
 class TestCrossDocNeighborBaseScore:
     def test_cross_doc_boost_uses_base_score(self):
         """Cross-doc neighbors must accumulate score from both base_score and graph weight."""
-        from retrieval.graph_retriever import GraphRetriever, CSSConfig
-        from core.embeddings import EmbeddingModel
-        from retrieval.vector_store import VectorStore
-        from unittest.mock import MagicMock, patch
-        import numpy as np
-
         kg = KnowledgeGraph()
         for nid, src in [("seed1", "FM 3-0"), ("xdoc1", "FM 6-0")]:
             kg.graph.add_node(nid)
@@ -290,13 +317,8 @@ class TestCrossDocNeighborBaseScore:
         kg.graph.add_edge("seed1", "xdoc1", weight=0.8, relation="cross_reference", evidence="FM 6-0")
 
         # Fake vector store returns seed1 as the only initial result
-        mock_vs = MagicMock(spec=VectorStore)
-        mock_vs.search.return_value = MagicMock(chunks=[kg.nodes["seed1"].chunk], scores=[0.6])
-
-        mock_emb = MagicMock(spec=EmbeddingModel)
-        mock_emb.encode_single.return_value = np.array([1.0, 0.0])
-
-        retriever = GraphRetriever(mock_vs, kg, mock_emb, final_top_k=5)
+        retriever = _make_retriever(kg, final_top_k=5)
+        retriever.vector_store.search.return_value = MagicMock(chunks=[kg.nodes["seed1"].chunk], scores=[0.6])
 
         with patch.object(kg, "get_cross_document_neighbors", return_value=[("xdoc1", 0.8)]):
             result = retriever.retrieve("What does FM 6-0 say?")
@@ -313,24 +335,14 @@ class TestCrossDocNeighborBaseScore:
 class TestTemporalDecayScaling:
     def test_temporal_weight_has_full_contribution(self):
         """A temporal weight of 0.0 should meaningfully lower the CSS score vs 1.0."""
-        from retrieval.graph_retriever import GraphRetriever, CSSConfig
-        from core.embeddings import EmbeddingModel
-        from retrieval.vector_store import VectorStore
-        from unittest.mock import MagicMock
-        import numpy as np
-
         kg = KnowledgeGraph()
         for nid in ["n1", "n2"]:
             kg.graph.add_node(nid)
             kg.nodes[nid] = _make_node(nid, "The commander leads operations.", source="FM 3-0")
 
-        mock_vs = MagicMock(spec=VectorStore)
-        mock_vs.search.return_value = MagicMock(chunks=[], scores=[])
-        mock_emb = MagicMock(spec=EmbeddingModel)
-        mock_emb.encode_single.return_value = np.array([1.0, 0.0])
-
         css = CSSConfig(temporal_recency=1.0)
-        retriever = GraphRetriever(mock_vs, kg, mock_emb, css_config=css)
+        retriever = _make_retriever(kg, css_config=css)
+        retriever.vector_store.search.return_value = MagicMock(chunks=[], scores=[])
 
         candidates = {"n1": 0.5, "n2": 0.5}
 
@@ -352,6 +364,54 @@ class TestTemporalDecayScaling:
         )
 
 
+# ---------------------------------------------------------------------------
+# Temporal weights cover only dated nodes and are cached per graph
+# ---------------------------------------------------------------------------
+
+class TestTemporalWeights:
+    def test_undated_nodes_omitted_from_weights(self):
+        """Undated chunks weigh 1.0 implicitly, so compute_weights only returns timestamped nodes."""
+        now = datetime(2026, 1, 10, tzinfo=timezone.utc)
+        kg = KnowledgeGraph()
+        kg.nodes["undated"] = _make_node("undated", "text")
+        dated = _make_node("dated", "text")
+        dated.chunk.timestamp = now - timedelta(hours=72)
+        kg.nodes["dated"] = dated
+
+        weights = TemporalDecayEngine(half_life_hours=72, reference_time=now).compute_weights(kg)
+        assert set(weights) == {"dated"}
+        assert weights["dated"] == pytest.approx(0.5)
+
+    def test_weights_cached_until_nodes_change(self):
+        """compute_weights is reused per graph and recomputed once the node map changes."""
+        now = datetime(2026, 1, 10, tzinfo=timezone.utc)
+        engine = TemporalDecayEngine(reference_time=now)
+        kg = KnowledgeGraph()
+        node = _make_node("n1", "text")
+        node.chunk.timestamp = now
+        kg.nodes["n1"] = node
+
+        first = engine.compute_weights(kg)
+        assert engine.compute_weights(kg) is first
+
+        extra = _make_node("n2", "text")
+        extra.chunk.timestamp = now
+        kg.nodes["n2"] = extra
+        assert set(engine.compute_weights(kg)) == {"n1", "n2"}
+
+    def test_cached_weights_are_read_only(self):
+        """The cached mapping is shared between callers, so it must not be mutable."""
+        now = datetime(2026, 1, 10, tzinfo=timezone.utc)
+        kg = KnowledgeGraph()
+        node = _make_node("n1", "text")
+        node.chunk.timestamp = now
+        kg.nodes["n1"] = node
+
+        weights = TemporalDecayEngine(reference_time=now).compute_weights(kg)
+        with pytest.raises(TypeError):
+            weights["n1"] = 0.0
+
+
 # ---------------------------------------------------------------------------
 # Fix #11 — Cross-doc neighbor cap raised from [:3] to [:final_top_k]
 # ---------------------------------------------------------------------------
@@ -359,12 +419,6 @@ class TestTemporalDecayScaling:
 class TestCrossDocNeighborCap:
     def test_cross_doc_cap_is_final_top_k(self):
         """GraphRetriever should fetch up to final_top_k cross-doc neighbors per seed."""
-        from retrieval.graph_retriever import GraphRetriever
-        from core.embeddings import EmbeddingModel
-        from retrieval.vector_store import VectorStore
-        from unittest.mock import MagicMock, patch
-        import numpy as np
-
         kg = KnowledgeGraph()
         kg.graph.add_node("seed")
         kg.nodes["seed"] = _make_node("seed", "seed text", source="FM 3-0")
@@ -375,14 +429,9 @@ class TestCrossDocNeighborCap:
             kg.nodes[nid] = _make_node(nid, f"cross text {i}", source="FM 6-0")
             kg.graph.add_edge("seed", nid, weight=0.5, relation="cross_reference", evidence="FM 6-0")
 
-        mock_vs = MagicMock(spec=VectorStore)
-        mock_vs.search.return_value = MagicMock(chunks=[kg.nodes["seed"].chunk], scores=[0.5])
-
-        mock_emb = MagicMock(spec=EmbeddingModel)
-        mock_emb.encode_single.return_value = np.array([1.0, 0.0])
-
         # final_top_k = 10 means cap should be 10, so all 8 should be reachable
-        retriever = GraphRetriever(mock_vs, kg, mock_emb, final_top_k=10)
+        retriever = _make_retriever(kg, final_top_k=10)
+        retriever.vector_store.search.return_value = MagicMock(chunks=[kg.nodes["seed"].chunk], scores=[0.5])
         result = retriever.retrieve("test query")
         retrieved_ids = {c.id for c in result.chunks}
         # With the old [:3] cap we'd only get 3 cross-doc chunks; with [:final_top_k] we get all 8
@@ -402,11 +451,6 @@ class TestSourceDiversityEnforcement:
         """Soft diversity penalty (April 15, 2026 fix): later same-source chunks get their
         score multiplicatively reduced. Unlike the previous hard cap, chunks are never
         dropped — but a competing FM with borderline scores should surface into the top-k."""
-        from retrieval.graph_retriever import GraphRetriever
-        from core.embeddings import EmbeddingModel
-        from retrieval.vector_store import VectorStore
-        from unittest.mock import MagicMock
-
         kg = KnowledgeGraph()
         for i in range(8):
             nid = f"fm30_{i}"
@@ -422,9 +466,7 @@ class TestSourceDiversityEnforcement:
         scored = [(f"fm30_{i}", 1.0 - i * 0.05) for i in range(8)] + \
                  [(f"fm60_{i}", 0.5 - i * 0.01) for i in range(4)]
 
-        mock_vs = MagicMock(spec=VectorStore)
-        mock_emb = MagicMock(spec=EmbeddingModel)
-        retriever = GraphRetriever(mock_vs, kg, mock_emb, final_top_k=final_top_k)
+        retriever = _make_retriever(kg, final_top_k=final_top_k)
 
         diversified = retriever._enforce_source_diversity(scored)
         top_k = diversified[:final_top_k]
@@ -438,12 +480,6 @@ class TestSourceDiversityEnforcement:
 
     def test_diversity_preserves_all_entries(self):
         """_enforce_source_diversity should not drop any candidates, only reorder."""
-        from retrieval.graph_retriever import GraphRetriever
-        from core.embeddings import EmbeddingModel
-        from retrieval.vector_store import VectorStore
-        from unittest.mock import MagicMock
-        import numpy as np
-
         kg = KnowledgeGraph()
         for i in range(5):
             nid = f"n{i}"
@@ -451,9 +487,44 @@ class TestSourceDiversityEnforcement:
             kg.nodes[nid] = _make_node(nid, f"text {i}", source=f"FM {i}")
 
         scored = [(f"n{i}", float(5 - i)) for i in range(5)]
-        mock_vs = MagicMock(spec=VectorStore)
-        mock_emb = MagicMock(spec=EmbeddingModel)
-        retriever = GraphRetriever(mock_vs, kg, mock_emb, final_top_k=5)
+        retriever = _make_retriever(kg, final_top_k=5)
 
         diversified = retriever._enforce_source_diversity(scored)
         assert len(diversified) == len(scored), "No candidates should be dropped by diversity enforcement"
+
+
+# ---------------------------------------------------------------------------
+# Chunk embeddings are encoded once per retriever
+# ---------------------------------------------------------------------------
+
+class TestChunkEmbeddingCache:
+    def test_cached_chunks_not_re_encoded(self):
+        """A second _css_score call should only encode the query side, not the chunks."""
+        kg = KnowledgeGraph()
+        for nid in ["n1", "n2"]:
+            kg.graph.add_node(nid)
+            kg.nodes[nid] = _make_node(nid, f"text {nid}")
+
+        retriever = _make_retriever(kg)
+
+        query = "commander operations"
+        n_query_texts = 1 + len(_decompose_query(query))
+        retriever._css_score(query, {"n1": 0.5, "n2": 0.5})
+        assert len(retriever.embedding_model.encode.call_args[0][0]) == n_query_texts + 2
+
+        retriever._css_score(query, {"n1": 0.5, "n2": 0.5})
+        assert len(retriever.embedding_model.encode.call_args[0][0]) == n_query_texts
+
+    def test_cache_evicts_least_recently_used(self):
+        """The embedding cache stays within its bound, dropping the least recently used chunk."""
+        kg = KnowledgeGraph()
+        for nid in ["n1", "n2", "n3"]:
+            kg.graph.add_node(nid)
+            kg.nodes[nid] = _make_node(nid, f"text {nid}")
+
+        retriever = _make_retriever(kg, embedding_cache_size=2)
+        retriever._css_score("query", {"n1": 0.5, "n2": 0.5})
+        retriever._css_score("query", {"n1": 0.5})
+        retriever._css_score("query", {"n3": 0.5})
+
+        assert list(retriever._chunk_vec_cache) == ["n1", "n3"]
@@ -0,0 +1,19 @@
+"""Tests for the paired-sample helpers in evaluation/statistical.py."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from evaluation.statistical import cohens_d, paired_wilcoxon
+
+
+@pytest.mark.parametrize("helper", [paired_wilcoxon, cohens_d])
+def test_unequal_lengths_rejected(helper):
+    with pytest.raises(ValueError, match="equal length"):
+        helper([0.1, 0.2, 0.3], [0.1, 0.2])
+
+
+def test_cohens_d_accepts_lists_and_arrays():
+    a, b = [0.9, 0.8, 0.7, 0.95], [0.5, 0.6, 0.4, 0.55]
+    assert cohens_d(a, b) == pytest.approx(cohens_d(np.array(a), np.array(b)))
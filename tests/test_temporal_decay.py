@@ -0,0 +1,36 @@
+"""Tests for the decay curve in sentinel/temporal_decay.py."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sentinel.temporal_decay import TemporalDecayEngine
+
+NOW = datetime(2026, 1, 10, tzinfo=timezone.utc)
+
+
+class TestDecaySettings:
+    def test_curve_follows_reassigned_threshold(self):
+        """The step curve and is_stale must agree after stale_threshold_hours changes."""
+        engine = TemporalDecayEngine(decay_function="step", stale_threshold_hours=168, reference_time=NOW)
+        timestamp = NOW - timedelta(hours=100)
+        assert engine.compute_weight(timestamp) == 1.0
+
+        engine.stale_threshold_hours = 48
+        assert engine.is_stale(timestamp)
+        assert engine.compute_weight(timestamp) == 0.3
+
+    def test_curve_follows_reassigned_half_life(self):
+        engine = TemporalDecayEngine(half_life_hours=72, reference_time=NOW)
+        timestamp = NOW - timedelta(hours=24)
+        engine.compute_weight(timestamp)
+
+        engine.half_life_hours = 24
+        assert engine.compute_weight(timestamp) == pytest.approx(0.5)
+
+    def test_zero_half_life_fails_on_use_not_construction(self):
+        engine = TemporalDecayEngine(half_life_hours=0, reference_time=NOW)
+        with pytest.raises(ZeroDivisionError):
+            engine.compute_weight(NOW - timedelta(hours=1))
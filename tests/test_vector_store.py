@@ -0,0 +1,58 @@
+"""Tests for batched search in retrieval/vector_store.py."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from core.data_models import DocumentChunk
+from core.embeddings import EmbeddingModel
+from retrieval.vector_store import VectorStore
+
+
+class _InnerProductIndex:
+    """Brute-force stand-in for faiss.IndexFlatIP; pads missing hits with index -1."""
+
+    def __init__(self, vectors: np.ndarray):
+        self.vectors = vectors
+
+    def search(self, queries: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        sims = queries @ self.vectors.T
+        order = np.argsort(-sims, axis=1, kind="stable")[:, :k]
+        scores = np.take_along_axis(sims, order, axis=1)
+        pad = k - order.shape[1]
+        return (
+            np.pad(scores, ((0, 0), (0, pad))),
+            np.pad(order, ((0, 0), (0, pad)), constant_values=-1),
+        )
+
+
+class TestVectorStoreSearchBatch:
+    def test_batch_matches_single_searches(self):
+        vectors = {
+            "alpha": [1.0, 0.0, 0.0],
+            "bravo": [0.6, 0.8, 0.0],
+            "charlie": [0.0, 0.0, 1.0],
+        }
+        emb = MagicMock(spec=EmbeddingModel)
+        emb.encode.side_effect = lambda texts: np.array([vectors[t] for t in texts])
+        emb.encode_single.side_effect = lambda text: np.array(vectors[text])
+
+        vs = VectorStore.__new__(VectorStore)
+        vs.embedding_model = emb
+        vs.chunks = [
+            DocumentChunk(id=f"c{i}", text=name, source_document="FM 3-0", section_id="1-1")
+            for i, name in enumerate(vectors)
+        ]
+        vs.index = _InnerProductIndex(np.array(list(vectors.values()), dtype=np.float32))
+
+        queries = list(vectors)
+        batch = vs.search_batch(queries, top_k=5, threshold=0.1)
+        assert len(batch) == len(queries)
+        for query, result in zip(queries, batch):
+            single = vs.search(query, top_k=5, threshold=0.1)
+            assert [c.id for c in result.chunks] == [c.id for c in single.chunks]
+            assert result.scores == pytest.approx(single.scores)
+            assert result.retrieval_method == single.retrieval_method